@@ -6,13 +6,22 @@ This module handles:
 - Creating isolated test databases for each test run via docker exec
 - Dropping test databases after tests complete
 - Waiting for PostgreSQL to be ready
+
+SQL goes through `docker exec psql` by default. If POSTGRES_PORT is published
+(see docker-compose.dev.yml) and psycopg is installed, a direct connection is
+used instead, which skips the process startup of every docker exec.
 """
 
 import os
 import time
 import subprocess
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
+
+try:
+    import psycopg
+except ImportError:
+    psycopg = None
 
 
 class TestDatabaseManager:
@@ -23,10 +32,57 @@ class TestDatabaseManager:
         self.user = os.getenv('POSTGRES_USER', 's3manager')
         self.password = os.getenv('POSTGRES_PASSWORD', 's3manager')
         self.db = os.getenv('POSTGRES_DB', 's3manager')
+        self.port = os.getenv('POSTGRES_PORT')
         
         self.test_db_name: Optional[str] = None
+        self._connections: Dict[str, 'psycopg.Connection'] = {}
+    
+    def _connect(self, database: str):
+        """Cached autocommit connection to the published port, or None to use docker exec."""
+        if psycopg is None or not self.port:
+            return None
+        
+        conn = self._connections.get(database)
+        if conn is None or conn.closed:
+            try:
+                conn = psycopg.connect(
+                    host='localhost', port=self.port, dbname=database,
+                    user=self.user, password=self.password,
+                    autocommit=True, connect_timeout=5
+                )
+            except psycopg.Error:
+                return None
+            self._connections[database] = conn
+        return conn
+    
+    def execute(self, command: str, database: Optional[str] = None) -> tuple:
+        """Run a SQL command, directly if possible, else via docker exec psql."""
+        db = database or self.db
+        conn = self._connect(db)
+        if conn is None:
+            return self._run_psql(command, db)
+        
+        try:
+            conn.execute(command)
+            return 0, '', ''
+        except psycopg.Error as e:
+            return 1, '', str(e)
+    
+    def fetch_value(self, query: str, database: Optional[str] = None) -> Optional[str]:
+        """Return the first column of the first row as text, or None on error."""
+        db = database or self.db
+        conn = self._connect(db)
+        if conn is None:
+            returncode, stdout, _ = self._run_psql(query, db, tuples_only=True)
+            return stdout.strip() if returncode == 0 else None
+        
+        try:
+            row = conn.execute(query).fetchone()
+        except psycopg.Error:
+            return None
+        return None if row is None else str(row[0])
     
-    def _run_psql(self, command: str, database: Optional[str] = None) -> tuple:
+    def _run_psql(self, command: str, database: Optional[str] = None, tuples_only: bool = False) -> tuple:
         """Run psql command inside the PostgreSQL container."""
         db = database or self.db
         
@@ -40,6 +96,9 @@ class TestDatabaseManager:
             '-d', db,
             '-c', command
         ]
+        if tuples_only:
+            # Bare values: no headers, alignment or row count footer
+            docker_cmd[-2:-2] = ['-t', '-A']
         
         result = subprocess.run(
             docker_cmd,
@@ -51,8 +110,8 @@ class TestDatabaseManager:
     
     def wait_for_postgres(self, timeout: int = 60) -> bool:
         """Wait for PostgreSQL to be ready using docker exec."""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        start_time = time.perf_counter()
+        while time.perf_counter() - start_time < timeout:
             try:
                 # Use pg_isready via docker exec
                 result = subprocess.run(
@@ -73,8 +132,8 @@ class TestDatabaseManager:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         self.test_db_name = f"s3manager_test_{timestamp}"
         
-        # Create database using psql via docker exec
-        returncode, stdout, stderr = self._run_psql(f'CREATE DATABASE "{self.test_db_name}"')
+        # Create database (psql via docker exec unless a direct connection is available)
+        returncode, stdout, stderr = self.execute(f'CREATE DATABASE "{self.test_db_name}"')
         
         if returncode != 0:
             raise RuntimeError(f"Failed to create test database: {stderr}")
@@ -94,7 +153,7 @@ class TestDatabaseManager:
         ]
         
         for cmd in commands:
-            returncode, stdout, stderr = self._run_psql(cmd)
+            returncode, stdout, stderr = self.execute(cmd)
             # Ignore errors for connection termination, but report drop errors
             if 'DROP DATABASE' in cmd and returncode != 0:
                 print(f"⚠ Warning: Failed to drop test database: {stderr}")
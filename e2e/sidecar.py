@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Long-lived Chromium for repeated E2E runs during development.
+
+Launches Chromium once with a CDP debugging port and records the endpoint in
+.e2e_profile/endpoint.txt. Runs started with E2E_REUSE=1 attach to it instead
+of launching their own browser.
+
+Usage:
+    cd e2e && python3 sidecar.py            # leave running in another terminal
+    E2E_REUSE=1 python3 test_runner.py
+"""
+
+import os
+import time
+from pathlib import Path
+
+from playwright.sync_api import sync_playwright
+
+profile_dir = Path(__file__).parent / '.e2e_profile'
+endpoint_file = profile_dir / 'endpoint.txt'
+
+
+def main():
+    port = int(os.getenv('E2E_CDP_PORT', '9222'))
+    headless = os.getenv('E2E_HEADED') is None
+
+    profile_dir.mkdir(exist_ok=True)
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(
+            headless=headless,
+            args=[f'--remote-debugging-port={port}']
+        )
+        endpoint_file.write_text(f'http://localhost:{port}')
+        print(f"Chromium {browser.version} listening on http://localhost:{port} (Ctrl+C to stop)")
+        try:
+            while browser.is_connected():
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if endpoint_file.exists():
+                endpoint_file.unlink()
+            browser.close()
+
+
+if __name__ == '__main__':
+    main()
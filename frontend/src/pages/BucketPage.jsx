@@ -557,6 +557,7 @@ const BucketPage = () => {
                 return (
                   <TableRow
                     key={key}
+                    data-testid={`file-row-${key}`}
                     hover
                     selected={isSelected}
                     onDoubleClick={() => {
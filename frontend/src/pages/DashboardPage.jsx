@@ -254,11 +254,12 @@ const DashboardPage = () => {
         <Grid container spacing={2}>
           {buckets.map((bucket) => (
             <Grid item xs={12} sm={6} md={4} key={bucket.name}>
-              <Card>
+              <Card data-testid={`bucket-card-${bucket.name}`}>
                 <CardContent>
                   <Box display="flex" alignItems="center" mb={2}>
                     <FolderIcon color="primary" sx={{ mr: 1 }} />
                     <Typography
+                      data-testid={`bucket-link-${bucket.name}`}
                       variant="h6"
                       noWrap
                       sx={{ cursor: 'pointer' }}